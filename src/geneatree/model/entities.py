@@ -1,17 +1,28 @@
 from __future__ import annotations
 
+import sys
+from collections.abc import Hashable
 from dataclasses import dataclass, field
 from typing import Any, Literal
 from uuid import uuid4
 
 RelationshipType = Literal["parent", "spouse"]
 
+# dataclass(slots=True) needs Python 3.10+; on 3.9 the classes keep a __dict__.
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 def new_id() -> str:
     return uuid4().hex
 
 
-@dataclass
+def relationship_key(relationship_type: str, from_id: str, to_id: str) -> Hashable:
+    if relationship_type == "spouse":
+        return frozenset((from_id, to_id))
+    return (relationship_type, from_id, to_id)
+
+
+@dataclass(**_SLOTS)
 class Position:
     x: float = 0.0
     y: float = 0.0
@@ -23,10 +34,11 @@ class Position:
     def from_dict(cls, data: dict[str, Any] | None) -> Position:
         if not data:
             return cls()
-        return cls(x=float(data.get("x", 0.0)), y=float(data.get("y", 0.0)))
+        get = data.get
+        return cls(x=float(get("x", 0.0)), y=float(get("y", 0.0)))
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Person:
     id: str = field(default_factory=new_id)
     display_name: str = "Новый человек"
@@ -39,7 +51,7 @@ class Person:
     pos: Position = field(default_factory=Position)
     style: dict[str, Any] = field(default_factory=dict)
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, *, copy: bool = True) -> dict[str, Any]:
         return {
             "id": self.id,
             "display_name": self.display_name,
@@ -50,26 +62,27 @@ class Person:
             "note": self.note,
             "photo_path": self.photo_path,
             "pos": self.pos.to_dict(),
-            "style": dict(self.style),
+            "style": dict(self.style) if copy else self.style,
         }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Person:
+        get = data.get
         return cls(
-            id=str(data.get("id") or new_id()),
-            display_name=str(data.get("display_name") or "Новый человек"),
-            full_name=data.get("full_name"),
-            gender=data.get("gender"),
-            birth_date=data.get("birth_date"),
-            death_date=data.get("death_date"),
-            note=data.get("note"),
-            photo_path=data.get("photo_path"),
-            pos=Position.from_dict(data.get("pos")),
-            style=dict(data.get("style") or {}),
+            id=str(get("id") or new_id()),
+            display_name=str(get("display_name") or "Новый человек"),
+            full_name=get("full_name"),
+            gender=get("gender"),
+            birth_date=get("birth_date"),
+            death_date=get("death_date"),
+            note=get("note"),
+            photo_path=get("photo_path"),
+            pos=Position.from_dict(get("pos")),
+            style=dict(get("style") or {}),
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Relationship:
     id: str = field(default_factory=new_id)
     type: RelationshipType = "parent"
@@ -77,30 +90,34 @@ class Relationship:
     to_id: str = ""
     meta: dict[str, Any] = field(default_factory=dict)
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, *, copy: bool = True) -> dict[str, Any]:
         return {
             "id": self.id,
             "type": self.type,
             "from_id": self.from_id,
             "to_id": self.to_id,
-            "meta": dict(self.meta),
+            "meta": dict(self.meta) if copy else self.meta,
         }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Relationship:
-        rel_type = data.get("type", "parent")
+        get = data.get
+        rel_type = get("type", "parent")
         if rel_type not in {"parent", "spouse"}:
             raise ValueError(f"Unsupported relationship type: {rel_type}")
         return cls(
-            id=str(data.get("id") or new_id()),
-            type=rel_type,
-            from_id=str(data.get("from_id") or ""),
-            to_id=str(data.get("to_id") or ""),
-            meta=dict(data.get("meta") or {}),
+            id=str(get("id") or new_id()),
+            type=sys.intern(rel_type),
+            from_id=str(get("from_id") or ""),
+            to_id=str(get("to_id") or ""),
+            meta=dict(get("meta") or {}),
         )
 
+    def key(self) -> Hashable:
+        return relationship_key(self.type, self.from_id, self.to_id)
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class TreeSettings:
     page_size: str = "A4"
     orientation: str = "portrait"
@@ -125,52 +142,91 @@ class TreeSettings:
     def from_dict(cls, data: dict[str, Any] | None) -> TreeSettings:
         if not data:
             return cls()
+        get = data.get
         return cls(
-            page_size=str(data.get("page_size", "A4")),
-            orientation=str(data.get("orientation", "portrait")),
-            margin_mm=float(data.get("margin_mm", 10.0)),
-            card_width=float(data.get("card_width", 190.0)),
-            card_height=float(data.get("card_height", 110.0)),
-            generation_spacing=float(data.get("generation_spacing", 190.0)),
-            sibling_spacing=float(data.get("sibling_spacing", 230.0)),
+            page_size=str(get("page_size", "A4")),
+            orientation=str(get("orientation", "portrait")),
+            margin_mm=float(get("margin_mm", 10.0)),
+            card_width=float(get("card_width", 190.0)),
+            card_height=float(get("card_height", 110.0)),
+            generation_spacing=float(get("generation_spacing", 190.0)),
+            sibling_spacing=float(get("sibling_spacing", 230.0)),
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TreeProject:
     project_version: int = 1
     people: list[Person] = field(default_factory=list)
     relationships: list[Relationship] = field(default_factory=list)
     settings: TreeSettings = field(default_factory=TreeSettings)
     assets_manifest: dict[str, Any] = field(default_factory=dict)
-
-    def to_dict(self) -> dict[str, Any]:
+    _people_index: dict[str, Person] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _people_index_source: list[Person] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def to_dict(self, *, copy: bool = True) -> dict[str, Any]:
+        # copy=False shares the nested dicts with the live objects.
         return {
             "project_version": int(self.project_version),
-            "people": [person.to_dict() for person in self.people],
-            "relationships": [rel.to_dict() for rel in self.relationships],
+            "people": [person.to_dict(copy=copy) for person in self.people],
+            "relationships": [rel.to_dict(copy=copy) for rel in self.relationships],
             "settings": self.settings.to_dict(),
-            "assets_manifest": dict(self.assets_manifest),
+            "assets_manifest": dict(self.assets_manifest) if copy else self.assets_manifest,
         }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> TreeProject:
+        get = data.get
+        person_from_dict = Person.from_dict
+        relationship_from_dict = Relationship.from_dict
         return cls(
-            project_version=int(data.get("project_version", 1)),
-            people=[Person.from_dict(item) for item in data.get("people", [])],
-            relationships=[Relationship.from_dict(item) for item in data.get("relationships", [])],
-            settings=TreeSettings.from_dict(data.get("settings")),
-            assets_manifest=dict(data.get("assets_manifest") or {}),
+            project_version=int(get("project_version", 1)),
+            people=[person_from_dict(item) for item in get("people", [])],
+            relationships=[relationship_from_dict(item) for item in get("relationships", [])],
+            settings=TreeSettings.from_dict(get("settings")),
+            assets_manifest=dict(get("assets_manifest") or {}),
         )
 
     def people_by_id(self) -> dict[str, Person]:
-        return {person.id: person for person in self.people}
+        # Read-only; call invalidate_people_index() after editing `people` in place.
+        index = self._current_people_index()
+        if index is None:
+            index = {person.id: person for person in self.people}
+            self._people_index = index
+            self._people_index_source = self.people
+        return index
+
+    def invalidate_people_index(self) -> None:
+        self._people_index = None
+        self._people_index_source = None
+
+    def _current_people_index(self) -> dict[str, Person] | None:
+        index = self._people_index
+        if index is None or self._people_index_source is not self.people:
+            return None
+        if len(index) != len(self.people):
+            return None
+        return index
 
     def get_person(self, person_id: str) -> Person | None:
         return self.people_by_id().get(person_id)
 
+    def add_person(self, person: Person) -> None:
+        index = self._current_people_index()
+        self.people.append(person)
+        if index is not None:
+            index[person.id] = person
+
     def remove_person(self, person_id: str) -> None:
+        index = self._current_people_index()
         self.people = [person for person in self.people if person.id != person_id]
+        if index is not None:
+            index.pop(person_id, None)
+            self._people_index_source = self.people
         self.relationships = [
             rel for rel in self.relationships if rel.from_id != person_id and rel.to_id != person_id
         ]
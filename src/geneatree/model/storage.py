@@ -1,12 +1,24 @@
 from __future__ import annotations
 
 import json
+import os
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
-from .entities import TreeProject
+from .entities import Person, TreeProject
 from .validation import assert_valid_project
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+_MAX_COPY_WORKERS = 8
+
 
 class StorageError(Exception):
     pass
@@ -19,6 +31,69 @@ def _resolve_input_photo_path(photo_path: str, project_dir: Path) -> Path:
     return project_dir / path
 
 
+def _copy_asset(source_path: Path, target_path: Path) -> None:
+    shutil.copyfile(source_path, target_path)
+    try:
+        shutil.copystat(source_path, target_path)
+    except OSError:
+        pass
+
+
+def _copy_assets(jobs: list[tuple[Path, Path]]) -> None:
+    try:
+        if len(jobs) > 1:
+            with ThreadPoolExecutor(max_workers=min(_MAX_COPY_WORKERS, len(jobs))) as executor:
+                list(executor.map(lambda job: _copy_asset(*job), jobs))
+        else:
+            for source_path, target_path in jobs:
+                _copy_asset(source_path, target_path)
+    except OSError as exc:
+        raise StorageError(f"Не удалось скопировать фото: {exc.filename}") from exc
+
+
+def _write_json(fd: int, payload: dict[str, Any]) -> None:
+    if orjson is not None:
+        view = memoryview(
+            orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        while view:
+            view = view[os.write(fd, view) :]
+        return
+    with os.fdopen(
+        fd, "w", encoding="utf-8", newline="", buffering=1 << 20, closefd=False
+    ) as stream:
+        json.dump(payload, stream, ensure_ascii=False, indent=2)
+
+
+def _write_atomic(target_path: Path, payload: dict[str, Any]) -> None:
+    target_path = Path(os.path.realpath(target_path))
+    try:
+        mode: int | None = stat.S_IMODE(target_path.stat().st_mode)
+    except FileNotFoundError:
+        mode = None
+    tmp_path = target_path.with_name(target_path.name + ".tmp")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    try:
+        fd = os.open(tmp_path, flags, 0o666)
+        try:
+            if mode is not None:
+                os.chmod(tmp_path, mode)
+            _write_json(fd, payload)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, target_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _loads(raw: bytes) -> dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
 def save_project(project: TreeProject, path: str | Path) -> None:
     assert_valid_project(project)
 
@@ -28,8 +103,10 @@ def save_project(project: TreeProject, path: str | Path) -> None:
     assets_dir = project_dir / "assets"
     assets_dir.mkdir(parents=True, exist_ok=True)
 
-    payload = project.to_dict()
+    payload = project.to_dict(copy=False)
     assets_manifest: dict[str, str] = {}
+    staged: list[tuple[int, Person, str]] = []
+    copy_jobs: list[tuple[Path, Path]] = []
 
     for index, person in enumerate(project.people):
         if not person.photo_path:
@@ -43,10 +120,15 @@ def save_project(project: TreeProject, path: str | Path) -> None:
         asset_rel_path = Path("assets") / f"{person.id}{suffix.lower()}"
         asset_abs_path = project_dir / asset_rel_path
 
-        if source_path.resolve() != asset_abs_path.resolve():
-            shutil.copy2(source_path, asset_abs_path)
+        if str(source_path) != str(asset_abs_path) and (
+            source_path.resolve() != asset_abs_path.resolve()
+        ):
+            copy_jobs.append((source_path, asset_abs_path))
+        staged.append((index, person, asset_rel_path.as_posix()))
 
-        normalized = asset_rel_path.as_posix()
+    _copy_assets(copy_jobs)
+
+    for index, person, normalized in staged:
         payload["people"][index]["photo_path"] = normalized
         person.photo_path = normalized
         assets_manifest[person.id] = normalized
@@ -54,10 +136,7 @@ def save_project(project: TreeProject, path: str | Path) -> None:
     payload["assets_manifest"] = assets_manifest
 
     try:
-        target_path.write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        _write_atomic(target_path, payload)
     except OSError as exc:
         raise StorageError(f"Не удалось сохранить проект: {target_path}") from exc
 
@@ -65,10 +144,10 @@ def save_project(project: TreeProject, path: str | Path) -> None:
 def load_project(path: str | Path) -> TreeProject:
     source_path = Path(path)
     try:
-        raw = json.loads(source_path.read_text(encoding="utf-8"))
+        raw = _loads(source_path.read_bytes())
     except OSError as exc:
         raise StorageError(f"Не удалось прочитать файл проекта: {source_path}") from exc
-    except json.JSONDecodeError as exc:
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise StorageError(f"Файл проекта не является корректным JSON: {source_path}") from exc
 
     try:
@@ -1,81 +1,104 @@
 from __future__ import annotations
 
-from collections import Counter
-
 from .entities import TreeProject
 
 
-def _has_parent_cycle(children_by_parent: dict[str, set[str]]) -> bool:
+def _has_parent_cycle(children_by_parent: dict[str, list[str]]) -> bool:
     # 0 = unvisited, 1 = visiting, 2 = visited
     state: dict[str, int] = {person_id: 0 for person_id in children_by_parent}
 
-    def visit(person_id: str) -> bool:
-        current = state.get(person_id, 0)
-        if current == 1:
-            return True
-        if current == 2:
-            return False
-
-        state[person_id] = 1
-        for child_id in children_by_parent.get(person_id, set()):
-            if visit(child_id):
-                return True
-        state[person_id] = 2
-        return False
-
-    return any(visit(person_id) for person_id in children_by_parent if state[person_id] == 0)
+    for root_id in children_by_parent:
+        if state[root_id] != 0:
+            continue
+
+        state[root_id] = 1
+        stack = [(root_id, iter(children_by_parent[root_id]))]
+        while stack:
+            person_id, children = stack[-1]
+            for child_id in children:
+                child_state = state.get(child_id, 0)
+                if child_state == 1:
+                    return True
+                if child_state == 0:
+                    state[child_id] = 1
+                    stack.append((child_id, iter(children_by_parent.get(child_id, ()))))
+                    break
+            else:
+                state[person_id] = 2
+                stack.pop()
+
+    return False
 
 
 def validate_project(project: TreeProject) -> list[str]:
     errors: list[str] = []
 
-    person_ids = [person.id for person in project.people]
-    duplicate_person_ids = {pid for pid, count in Counter(person_ids).items() if count > 1}
-    if duplicate_person_ids:
-        errors.append(f"Duplicate person ids: {sorted(duplicate_person_ids)}")
-
+    known_people: set[str] = set()
+    duplicate_person_ids: set[str] = set()
+    name_errors: list[str] = []
     for person in project.people:
+        person_id = person.id
+        if person_id in known_people:
+            duplicate_person_ids.add(person_id)
+        else:
+            known_people.add(person_id)
+
         display_name = str(person.display_name or "").strip()
         full_name = str(person.full_name or "").strip() if person.full_name else ""
         if not display_name and not full_name:
-            errors.append(f"Person {person.id} has no display_name or full_name")
+            name_errors.append(f"Person {person_id} has no display_name or full_name")
 
-    relationship_ids = [rel.id for rel in project.relationships]
-    duplicate_relationship_ids = {
-        rid for rid, count in Counter(relationship_ids).items() if count > 1
-    }
-    if duplicate_relationship_ids:
-        errors.append(f"Duplicate relationship ids: {sorted(duplicate_relationship_ids)}")
+    if duplicate_person_ids:
+        errors.append(f"Duplicate person ids: {sorted(duplicate_person_ids)}")
+    errors.extend(name_errors)
 
-    known_people = set(person_ids)
+    relationship_ids: set[str] = set()
+    duplicate_relationship_ids: set[str] = set()
     parent_pairs: set[tuple[str, str]] = set()
     spouse_pairs: set[tuple[str, str]] = set()
-    children_by_parent: dict[str, set[str]] = {person_id: set() for person_id in known_people}
+    relationship_errors: list[str] = []
+    children_by_parent: dict[str, list[str]] = {person_id: [] for person_id in known_people}
 
     for rel in project.relationships:
+        if rel.id in relationship_ids:
+            duplicate_relationship_ids.add(rel.id)
+        else:
+            relationship_ids.add(rel.id)
+
         if rel.type not in {"parent", "spouse"}:
-            errors.append(f"Unknown relationship type: {rel.id}:{rel.type}")
+            relationship_errors.append(f"Unknown relationship type: {rel.id}:{rel.type}")
         if rel.from_id not in known_people:
-            errors.append(f"Relationship {rel.id} references missing from_id={rel.from_id}")
+            relationship_errors.append(
+                f"Relationship {rel.id} references missing from_id={rel.from_id}"
+            )
         if rel.to_id not in known_people:
-            errors.append(f"Relationship {rel.id} references missing to_id={rel.to_id}")
+            relationship_errors.append(
+                f"Relationship {rel.id} references missing to_id={rel.to_id}"
+            )
         if rel.from_id == rel.to_id:
-            errors.append(f"Relationship {rel.id} links person to itself")
+            relationship_errors.append(f"Relationship {rel.id} links person to itself")
 
         if rel.type == "parent":
             key = (rel.from_id, rel.to_id)
             if key in parent_pairs:
-                errors.append(f"Duplicate parent relationship: {rel.from_id}->{rel.to_id}")
+                relationship_errors.append(
+                    f"Duplicate parent relationship: {rel.from_id}->{rel.to_id}"
+                )
+                continue
             parent_pairs.add(key)
 
             if rel.from_id in known_people and rel.to_id in known_people:
-                children_by_parent[rel.from_id].add(rel.to_id)
+                children_by_parent[rel.from_id].append(rel.to_id)
         elif rel.type == "spouse":
             key = tuple(sorted((rel.from_id, rel.to_id)))
             if key in spouse_pairs:
-                errors.append(f"Duplicate spouse relationship: {key[0]}<->{key[1]}")
+                relationship_errors.append(f"Duplicate spouse relationship: {key[0]}<->{key[1]}")
             spouse_pairs.add(key)
 
+    if duplicate_relationship_ids:
+        errors.append(f"Duplicate relationship ids: {sorted(duplicate_relationship_ids)}")
+    errors.extend(relationship_errors)
+
     if _has_parent_cycle(children_by_parent):
         errors.append("Parent relationships contain a cycle")
 
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 
 from PySide6.QtCore import QMarginsF, QRectF, Qt
-from PySide6.QtGui import QPageLayout, QPageSize, QPainter, QPdfWriter
-from PySide6.QtWidgets import QGraphicsScene
+from PySide6.QtGui import QColor, QImage, QPageLayout, QPageSize, QPainter, QPdfWriter
+from PySide6.QtWidgets import QGraphicsItem, QGraphicsScene
 
 
 @dataclass
@@ -15,6 +17,7 @@ class PdfExportOptions:
     margin_mm: float = 10.0
     fit_to_page: bool = True
     dpi: int = 300
+    rasterize: bool = False
 
 
 def _page_size_id(value: str) -> QPageSize.PageSizeId:
@@ -27,6 +30,23 @@ def _page_size_id(value: str) -> QPageSize.PageSizeId:
     return mapping.get(normalized, QPageSize.PageSizeId.A4)
 
 
+@contextmanager
+def _items_uncached(scene: QGraphicsScene) -> Iterator[None]:
+    # Cached items would otherwise be embedded in the PDF as bitmaps.
+    cached = [
+        (item, item.cacheMode())
+        for item in scene.items()
+        if item.cacheMode() != QGraphicsItem.CacheMode.NoCache
+    ]
+    for item, _mode in cached:
+        item.setCacheMode(QGraphicsItem.CacheMode.NoCache)
+    try:
+        yield
+    finally:
+        for item, mode in cached:
+            item.setCacheMode(mode)
+
+
 def export_scene_to_pdf(
     scene: QGraphicsScene,
     output_path: str | Path,
@@ -57,13 +77,31 @@ def export_scene_to_pdf(
 
     target_rect = QRectF(page_layout.paintRectPixels(writer.resolution()))
 
+    mode = (
+        Qt.AspectRatioMode.KeepAspectRatio
+        if opts.fit_to_page
+        else Qt.AspectRatioMode.IgnoreAspectRatio
+    )
+
+    image: QImage | None = None
+    if opts.rasterize:
+        image = QImage(target_rect.size().toSize(), QImage.Format.Format_RGB32)
+        image.fill(QColor("white"))
+        image_painter = QPainter(image)
+        try:
+            image_painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+            image_painter.setRenderHint(QPainter.RenderHint.TextAntialiasing, True)
+            with _items_uncached(scene):
+                scene.render(image_painter, QRectF(image.rect()), source, mode)
+        finally:
+            image_painter.end()
+
     painter = QPainter(writer)
     try:
-        mode = (
-            Qt.AspectRatioMode.KeepAspectRatio
-            if opts.fit_to_page
-            else Qt.AspectRatioMode.IgnoreAspectRatio
-        )
-        scene.render(painter, target_rect, source, mode)
+        if image is not None:
+            painter.drawImage(target_rect, image)
+        else:
+            with _items_uncached(scene):
+                scene.render(painter, target_rect, source, mode)
     finally:
         painter.end()
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
-from PySide6.QtCore import QPointF, QRectF, Qt, Signal
+from PySide6.QtCore import QPointF, QRectF, Qt, QTimer, Signal
 from PySide6.QtGui import (
+    QBrush,
     QColor,
     QFont,
     QFontMetrics,
@@ -24,19 +25,61 @@ from PySide6.QtWidgets import (
 if TYPE_CHECKING:
     from geneatree.model.entities import Person
 
+_COLOR_BORDER = QColor("#0f172a")
+_COLOR_BORDER_SEL = QColor("#2563eb")
+_COLOR_BG = QColor("#f8fafc")
+_COLOR_PHOTO_BORDER = QColor("#cbd5e1")
+_COLOR_PHOTO_BG = QColor("#e2e8f0")
+_COLOR_INITIAL = QColor("#334155")
+_COLOR_NAME = QColor("#0f172a")
+_COLOR_SUB = QColor("#475569")
+_COLOR_NOTE = QColor("#64748b")
+_COLOR_EDGE = QColor("#334155")
+
+_PEN_BORDER = QPen(_COLOR_BORDER, 2)
+_PEN_BORDER_SEL = QPen(_COLOR_BORDER_SEL, 2)
+_PEN_PHOTO_BORDER = QPen(_COLOR_PHOTO_BORDER, 1)
+_PEN_EDGE = QPen(_COLOR_EDGE, 2)
+_BRUSH_BG = QBrush(_COLOR_BG)
+_BRUSH_PHOTO_BG = QBrush(_COLOR_PHOTO_BG)
+
 
 class PersonItem(QGraphicsObject):
     edit_requested = Signal(str)
     delete_requested = Signal(str)
     link_requested = Signal(str, str)
 
+    _PHOTO_RECT = QRectF(8, 8, 58, 58)
+
+    _INITIALS_FONT: ClassVar[QFont | None] = None
+    _NAME_FONT: ClassVar[QFont | None] = None
+    _SUBTITLE_FONT: ClassVar[QFont | None] = None
+    _NAME_METRICS: ClassVar[QFontMetrics | None] = None
+    _SUBTITLE_METRICS: ClassVar[QFontMetrics | None] = None
+
+    @classmethod
+    def _ensure_fonts(cls) -> None:
+        if cls._NAME_FONT is not None:
+            return
+        cls._INITIALS_FONT = QFont("Helvetica", 16, weight=QFont.Weight.Bold)
+        cls._NAME_FONT = QFont("Helvetica", 10, weight=QFont.Weight.Bold)
+        cls._SUBTITLE_FONT = QFont("Helvetica", 8)
+        cls._NAME_METRICS = QFontMetrics(cls._NAME_FONT)
+        cls._SUBTITLE_METRICS = QFontMetrics(cls._SUBTITLE_FONT)
+
     def __init__(self, person: Person, width: float, height: float) -> None:
         super().__init__()
+        self._ensure_fonts()
         self.person = person
         self.width = width
         self.height = height
         self.edges: list[EdgeItem] = []
         self._photo = QPixmap()
+        self._photo_offset = QPointF()
+        self._elide_cache: dict[tuple[str, int, int], str] = {}
+        self._edge_flush_pending = False
+        self._photo_path = person.photo_path
+        self._text_key = self._person_text_key(person)
 
         self.setFlags(
             QGraphicsItem.GraphicsItemFlag.ItemIsMovable
@@ -44,15 +87,73 @@ class PersonItem(QGraphicsObject):
             | QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges
         )
         self.setZValue(1)
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self.setPos(self.person.pos.x, self.person.pos.y)
         self.reload_photo()
 
+    @staticmethod
+    def _person_text_key(person: Person) -> tuple[str | None, ...]:
+        return (
+            person.display_name,
+            person.full_name,
+            person.birth_date,
+            person.death_date,
+            person.note,
+        )
+
+    def update_from(self, person: Person, width: float, height: float) -> None:
+        self.person = person
+        if width != self.width or height != self.height:
+            self.prepareGeometryChange()
+            self.width = width
+            self.height = height
+            self._elide_cache.clear()
+            self.update()
+        pos = self.pos()
+        if pos.x() != person.pos.x or pos.y() != person.pos.y:
+            self.setPos(person.pos.x, person.pos.y)
+        if person.photo_path != self._photo_path:
+            self._photo_path = person.photo_path
+            self.reload_photo()
+        text_key = self._person_text_key(person)
+        if text_key != self._text_key:
+            self._text_key = text_key
+            self.refresh_text()
+
+    def refresh_from_model(self) -> None:
+        self.update_from(self.person, self.width, self.height)
+
     def reload_photo(self) -> None:
         self._photo = QPixmap()
         if self.person.photo_path:
-            self._photo.load(self.person.photo_path)
+            source = QPixmap()
+            if source.load(self.person.photo_path):
+                rect = self._PHOTO_RECT
+                self._photo = source.scaled(
+                    int(rect.width()),
+                    int(rect.height()),
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation,
+                )
+                self._photo_offset = QPointF(
+                    int(rect.x() + (rect.width() - self._photo.width()) / 2),
+                    int(rect.y() + (rect.height() - self._photo.height()) / 2),
+                )
+        self.update()
+
+    def refresh_text(self) -> None:
+        self._elide_cache.clear()
         self.update()
 
+    def _elided(self, metrics: QFontMetrics, text: str, width: int) -> str:
+        # Metrics are shared class-level objects, so their id identifies the font.
+        key = (text, width, id(metrics))
+        elided = self._elide_cache.get(key)
+        if elided is None:
+            elided = metrics.elidedText(text, Qt.TextElideMode.ElideRight, width)
+            self._elide_cache[key] = elided
+        return elided
+
     def boundingRect(self) -> QRectF:
         return QRectF(0.0, 0.0, self.width, self.height)
 
@@ -61,10 +162,19 @@ class PersonItem(QGraphicsObject):
             pos = self.pos()
             self.person.pos.x = float(pos.x())
             self.person.pos.y = float(pos.y())
-            for edge in self.edges:
-                edge.update_path()
+            if self.edges:
+                for edge in self.edges:
+                    edge.mark_dirty()
+                if not self._edge_flush_pending:
+                    self._edge_flush_pending = True
+                    QTimer.singleShot(0, self, self._flush_dirty_edges)
         return super().itemChange(change, value)
 
+    def _flush_dirty_edges(self) -> None:
+        self._edge_flush_pending = False
+        for edge in self.edges:
+            edge.flush()
+
     def mouseDoubleClickEvent(self, event) -> None:  # noqa: ANN001
         self.edit_requested.emit(self.person.id)
         super().mouseDoubleClickEvent(event)
@@ -99,46 +209,34 @@ class PersonItem(QGraphicsObject):
         del option, widget
 
         rect = self.boundingRect()
-        selected = self.isSelected()
-        border_color = QColor("#0f172a") if not selected else QColor("#2563eb")
+        border_pen = _PEN_BORDER_SEL if self.isSelected() else _PEN_BORDER
 
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-        painter.setPen(QPen(border_color, 2))
-        painter.setBrush(QColor("#f8fafc"))
+        painter.setPen(border_pen)
+        painter.setBrush(_BRUSH_BG)
         painter.drawRoundedRect(rect, 10, 10)
 
-        photo_rect = QRectF(8, 8, 58, 58)
-        painter.setPen(QPen(QColor("#cbd5e1"), 1))
-        painter.setBrush(QColor("#e2e8f0"))
+        photo_rect = self._PHOTO_RECT
+        painter.setPen(_PEN_PHOTO_BORDER)
+        painter.setBrush(_BRUSH_PHOTO_BG)
         painter.drawRoundedRect(photo_rect, 6, 6)
 
         if not self._photo.isNull():
-            scaled = self._photo.scaled(
-                int(photo_rect.width()),
-                int(photo_rect.height()),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            pix_x = photo_rect.x() + (photo_rect.width() - scaled.width()) / 2
-            pix_y = photo_rect.y() + (photo_rect.height() - scaled.height()) / 2
-            painter.drawPixmap(int(pix_x), int(pix_y), scaled)
+            painter.drawPixmap(self._photo_offset, self._photo)
         else:
             initials = (self.person.display_name[:1] if self.person.display_name else "?").upper()
-            painter.setPen(QColor("#334155"))
-            painter.setFont(QFont("Helvetica", 16, weight=QFont.Weight.Bold))
+            painter.setPen(_COLOR_INITIAL)
+            painter.setFont(self._INITIALS_FONT)
             painter.drawText(photo_rect, Qt.AlignmentFlag.AlignCenter, initials)
 
         text_x = 74
         text_width = self.width - text_x - 8
 
-        name_font = QFont("Helvetica", 10, weight=QFont.Weight.Bold)
-        name_metrics = QFontMetrics(name_font)
-        painter.setFont(name_font)
-        painter.setPen(QColor("#0f172a"))
-        elided_name = name_metrics.elidedText(
-            self.person.display_name or "Без имени",
-            Qt.TextElideMode.ElideRight,
-            int(text_width),
+        name_metrics = self._NAME_METRICS
+        painter.setFont(self._NAME_FONT)
+        painter.setPen(_COLOR_NAME)
+        elided_name = self._elided(
+            name_metrics, self.person.display_name or "Без имени", int(text_width)
         )
         painter.drawText(
             QRectF(text_x, 8, text_width, 22),
@@ -146,10 +244,9 @@ class PersonItem(QGraphicsObject):
             elided_name,
         )
 
-        subtitle_font = QFont("Helvetica", 8)
-        subtitle_metrics = QFontMetrics(subtitle_font)
-        painter.setFont(subtitle_font)
-        painter.setPen(QColor("#475569"))
+        subtitle_metrics = self._SUBTITLE_METRICS
+        painter.setFont(self._SUBTITLE_FONT)
+        painter.setPen(_COLOR_SUB)
         life_range = ""
         birth = (self.person.birth_date or "").strip()
         death = (self.person.death_date or "").strip()
@@ -167,27 +264,22 @@ class PersonItem(QGraphicsObject):
             painter.drawText(
                 QRectF(text_x, 30, text_width, 18),
                 Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
-                subtitle_metrics.elidedText(line_1, Qt.TextElideMode.ElideRight, int(text_width)),
+                self._elided(subtitle_metrics, line_1, int(text_width)),
             )
         if line_2:
             painter.drawText(
                 QRectF(text_x, 46, text_width, 18),
                 Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
-                subtitle_metrics.elidedText(line_2, Qt.TextElideMode.ElideRight, int(text_width)),
+                self._elided(subtitle_metrics, line_2, int(text_width)),
             )
 
-        note_metrics = QFontMetrics(subtitle_font)
         note_text = (self.person.note or "").replace("\n", " ").strip()
         if note_text:
-            painter.setPen(QColor("#64748b"))
+            painter.setPen(_COLOR_NOTE)
             painter.drawText(
                 QRectF(8, 72, self.width - 16, self.height - 80),
                 Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop,
-                note_metrics.elidedText(
-                    note_text,
-                    Qt.TextElideMode.ElideRight,
-                    int(self.width - 16),
-                ),
+                self._elided(subtitle_metrics, note_text, int(self.width - 16)),
             )
 
 
@@ -197,8 +289,10 @@ class EdgeItem(QGraphicsPathItem):
         self.source = source
         self.target = target
         self.relationship_type = relationship_type
+        self._dirty = False
+        self._axis_aligned = False
 
-        self.setPen(QPen(QColor("#334155"), 2))
+        self.setPen(_PEN_EDGE)
         self.setZValue(-1)
 
         self.source.edges.append(self)
@@ -211,27 +305,60 @@ class EdgeItem(QGraphicsPathItem):
         if self in self.target.edges:
             self.target.edges.remove(self)
 
+    def mark_dirty(self) -> None:
+        self._dirty = True
+
+    def flush(self) -> None:
+        if self._dirty:
+            self.update_path()
+
     def update_path(self) -> None:
-        source_rect = self.source.sceneBoundingRect()
-        target_rect = self.target.sceneBoundingRect()
+        self._dirty = False
+        source, target = self.source, self.target
+        source_pos = source.pos()
+        target_pos = target.pos()
+        source_left = source_pos.x()
+        source_top = source_pos.y()
+        target_left = target_pos.x()
+        target_top = target_pos.y()
+        source_center_x = source_left + source.width / 2
+        target_center_x = target_left + target.width / 2
 
         path = QPainterPath()
         if self.relationship_type == "spouse":
-            if source_rect.center().x() <= target_rect.center().x():
-                start = QPointF(source_rect.right(), source_rect.center().y())
-                end = QPointF(target_rect.left(), target_rect.center().y())
+            source_center_y = source_top + source.height / 2
+            target_center_y = target_top + target.height / 2
+            if source_center_x <= target_center_x:
+                start = QPointF(source_left + source.width, source_center_y)
+                end = QPointF(target_left, target_center_y)
             else:
-                start = QPointF(source_rect.left(), source_rect.center().y())
-                end = QPointF(target_rect.right(), target_rect.center().y())
+                start = QPointF(source_left, source_center_y)
+                end = QPointF(target_left + target.width, target_center_y)
             path.moveTo(start)
             path.lineTo(end)
+            self._axis_aligned = start.y() == end.y()
         else:
-            start = QPointF(source_rect.center().x(), source_rect.bottom())
-            end = QPointF(target_rect.center().x(), target_rect.top())
+            start = QPointF(source_center_x, source_top + source.height)
+            end = QPointF(target_center_x, target_top)
             mid_y = (start.y() + end.y()) / 2
             path.moveTo(start)
             path.lineTo(QPointF(start.x(), mid_y))
             path.lineTo(QPointF(end.x(), mid_y))
             path.lineTo(end)
+            self._axis_aligned = True
 
         self.setPath(path)
+
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionGraphicsItem,
+        widget: QWidget | None = None,
+    ) -> None:
+        if not self._axis_aligned:
+            super().paint(painter, option, widget)
+            return
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        super().paint(painter, option, widget)
+        painter.restore()
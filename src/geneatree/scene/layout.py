@@ -1,27 +1,29 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import defaultdict, deque
 
 from geneatree.model.entities import TreeProject
 
 
 def compute_generations(project: TreeProject) -> dict[str, int]:
     levels = {person.id: 0 for person in project.people}
-    parent_edges = [
-        (rel.from_id, rel.to_id)
-        for rel in project.relationships
-        if rel.type == "parent" and rel.from_id in levels and rel.to_id in levels
-    ]
-
-    for _ in range(max(1, len(levels))):
-        changed = False
-        for parent_id, child_id in parent_edges:
-            candidate_level = levels[parent_id] + 1
-            if candidate_level > levels[child_id]:
-                levels[child_id] = candidate_level
-                changed = True
-        if not changed:
-            break
+    children_by_parent: dict[str, list[str]] = defaultdict(list)
+    in_degree = dict.fromkeys(levels, 0)
+    for rel in project.relationships:
+        if rel.type == "parent" and rel.from_id in levels and rel.to_id in levels:
+            children_by_parent[rel.from_id].append(rel.to_id)
+            in_degree[rel.to_id] += 1
+
+    queue = deque(person_id for person_id, degree in in_degree.items() if degree == 0)
+    while queue:
+        parent_id = queue.popleft()
+        child_level = levels[parent_id] + 1
+        for child_id in children_by_parent.get(parent_id, ()):
+            if child_level > levels[child_id]:
+                levels[child_id] = child_level
+            in_degree[child_id] -= 1
+            if in_degree[child_id] == 0:
+                queue.append(child_id)
 
     return levels
 
@@ -29,19 +31,26 @@ def compute_generations(project: TreeProject) -> dict[str, int]:
 def auto_layout(project: TreeProject, start_x: float = 0.0, start_y: float = 0.0) -> dict[str, int]:
     levels = compute_generations(project)
     people_by_id = project.people_by_id()
+    sibling_spacing = project.settings.sibling_spacing
+    generation_spacing = project.settings.generation_spacing
 
     groups: dict[int, list[str]] = defaultdict(list)
     for person_id, level in levels.items():
         groups[level].append(person_id)
 
+    sort_keys = {
+        person_id: (people_by_id[person_id].display_name.lower(), person_id) for person_id in levels
+    }
+
     for level, person_ids in groups.items():
-        person_ids.sort(key=lambda pid: (people_by_id[pid].display_name.lower(), pid))
-        row_width = (len(person_ids) - 1) * project.settings.sibling_spacing
+        person_ids.sort(key=sort_keys.__getitem__)
+        row_width = (len(person_ids) - 1) * sibling_spacing
         row_start = start_x - (row_width / 2)
+        row_y = start_y + level * generation_spacing
 
         for index, person_id in enumerate(person_ids):
-            person = people_by_id[person_id]
-            person.pos.x = row_start + index * project.settings.sibling_spacing
-            person.pos.y = start_y + level * project.settings.generation_spacing
+            pos = people_by_id[person_id].pos
+            pos.x = row_start + index * sibling_spacing
+            pos.y = row_y
 
     return levels
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-import re
+import os
+from collections.abc import Collection, Hashable
+from functools import lru_cache
+from typing import Any, Callable
 
-from PySide6.QtCore import QDate, Qt
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import QCoreApplication, QDate, QSignalBlocker, Qt, QTimer
+from PySide6.QtGui import QImageReader, QPixmap, QPixmapCache, QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import (
     QCalendarWidget,
     QCheckBox,
@@ -12,7 +15,6 @@ from PySide6.QtWidgets import (
     QDialogButtonBox,
     QFileDialog,
     QFormLayout,
-    QGridLayout,
     QHBoxLayout,
     QLabel,
     QLineEdit,
@@ -24,20 +26,114 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from geneatree.model.entities import Person, Relationship, new_id
+from geneatree.model.entities import Person, Relationship, new_id, relationship_key
 from geneatree.scene.export_pdf import PdfExportOptions
 
 DATE_FORMAT = "dd.MM.yyyy"
-YEAR_PATTERN = re.compile(r"^\d{4}$")
+_DATE_FORMATS = (DATE_FORMAT, "yyyy-MM-dd", "yyyy")
+
+_GENDER_CHOICES = (
+    ("Не указан", ""),
+    ("Мужской", "male"),
+    ("Женский", "female"),
+    ("Другой", "other"),
+)
+_RELATIONSHIP_TYPE_CHOICES = (("Родитель -> ребенок", "parent"), ("Супруги", "spouse"))
+_PAGE_SIZE_CHOICES = (("A4", "A4"), ("A3", "A3"), ("Letter (US)", "Letter"))
+_ORIENTATION_CHOICES = (("Книжная", "portrait"), ("Альбомная", "landscape"))
+_choice_models: dict[tuple[tuple[str, str], ...], QStandardItemModel] = {}
+
+
+def _normalized_raw_date(value: str) -> str:
+    text = value.strip().replace("_", "")
+    if not any(ch.isdigit() for ch in text):
+        return ""
+    return text
+
+
+@lru_cache(maxsize=512)
+def _parse_normalized_date(text: str) -> QDate | None:
+    for fmt in _DATE_FORMATS:
+        parsed = QDate.fromString(text, fmt)
+        if parsed.isValid():
+            return parsed
+    return None
+
+
+def _choice_model(choices: tuple[tuple[str, str], ...]) -> QStandardItemModel:
+    model = _choice_models.get(choices)
+    if model is None:
+        model = QStandardItemModel(len(choices), 1, QCoreApplication.instance())
+        for row, (label, data) in enumerate(choices):
+            item = QStandardItem(label)
+            item.setData(data, Qt.ItemDataRole.UserRole)
+            model.setItem(row, 0, item)
+        model.destroyed.connect(lambda: _choice_models.pop(choices, None))
+        _choice_models[choices] = model
+    return model
+
+
+def _set_combo_by_data(combo: QComboBox, value: Any) -> None:
+    index = combo.findData(value)
+    if index >= 0:
+        combo.setCurrentIndex(index)
+
+
+def _preview_pixmap(path: str, width: int, height: int) -> QPixmap:
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return QPixmap()
+    key = f"geneatree-preview:{path}:{mtime}:{width}x{height}"
+    cached = QPixmapCache.find(key)
+    if cached is not None:
+        return cached
+
+    reader = QImageReader(path)
+    source_size = reader.size()
+    if source_size.width() > width * 2 or source_size.height() > height * 2:
+        reader.setScaledSize(
+            source_size.scaled(width * 2, height * 2, Qt.AspectRatioMode.KeepAspectRatio)
+        )
+    image = reader.read()
+    if image.isNull():
+        return QPixmap()
+    pixmap = QPixmap.fromImage(image)
+    if pixmap.width() > width * 4 or pixmap.height() > height * 4:
+        pixmap = pixmap.scaled(
+            width * 4,
+            height * 4,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.FastTransformation,
+        )
+    scaled = pixmap.scaled(
+        width,
+        height,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
+    QPixmapCache.insert(key, scaled)
+    return scaled
+
+
+def _ok_cancel_box(
+    parent: QWidget, accept: Callable[[], None], reject: Callable[[], None]
+) -> QDialogButtonBox:
+    box = QDialogButtonBox(
+        QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel, parent
+    )
+    box.accepted.connect(accept)
+    box.rejected.connect(reject)
+    return box
 
 
 def short_name_from_full_name(full_name: str) -> str:
-    parts = [part for part in full_name.replace(",", " ").split() if part]
+    parts = full_name.replace(",", " ").split(None, 2)
     if not parts:
         return ""
     if len(parts) == 1:
         return parts[0]
-    return " ".join(parts[:2])
+    return f"{parts[0]} {parts[1]}"
 
 
 class PersonDialog(QDialog):
@@ -46,6 +142,8 @@ class PersonDialog(QDialog):
         self.setWindowTitle("Человек")
         self._source_person = person
         self._last_auto_display_name = ""
+        self._photo_dialog: QFileDialog | None = None
+        self._validated: tuple[str, str | None, str | None, str | None] | None = None
 
         self.display_name_edit = QLineEdit()
         self.display_name_edit.setPlaceholderText("Короткое имя на карточке, например: Иван")
@@ -56,10 +154,7 @@ class PersonDialog(QDialog):
         self.auto_short_name_check = QCheckBox("Автоматически брать короткое имя из ФИО")
 
         self.gender_combo = QComboBox()
-        self.gender_combo.addItem("Не указан", "")
-        self.gender_combo.addItem("Мужской", "male")
-        self.gender_combo.addItem("Женский", "female")
-        self.gender_combo.addItem("Другой", "other")
+        self.gender_combo.setModel(_choice_model(_GENDER_CHOICES))
 
         self.birth_date_edit, birth_date_field = self._build_date_field("Дата рождения")
         self.death_date_edit, death_date_field = self._build_date_field("Дата смерти")
@@ -94,21 +189,19 @@ class PersonDialog(QDialog):
         form.addRow("Заметка", self.note_edit)
         form.addRow("Фото", photo_row)
 
-        preview_grid = QGridLayout()
-        preview_grid.addWidget(self.photo_preview, 0, 0, alignment=Qt.AlignmentFlag.AlignLeft)
-
-        button_box = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
-        )
-        button_box.accepted.connect(self._accept)
-        button_box.rejected.connect(self.reject)
+        button_box = _ok_cancel_box(self, self._accept, self.reject)
 
         layout = QVBoxLayout(self)
         layout.addLayout(form)
-        layout.addLayout(preview_grid)
+        layout.addWidget(self.photo_preview, 0, Qt.AlignmentFlag.AlignLeft)
         layout.addWidget(button_box)
 
-        self.full_name_edit.textChanged.connect(self._on_full_name_changed)
+        self._short_name_timer = QTimer(self)
+        self._short_name_timer.setSingleShot(True)
+        self._short_name_timer.setInterval(50)
+        self._short_name_timer.timeout.connect(self._apply_auto_short_name)
+
+        self._tracking_full_name = False
         self.auto_short_name_check.toggled.connect(self._on_auto_short_name_toggled)
 
         auto_short_name_default = person is None or not (person.display_name if person else "")
@@ -117,7 +210,7 @@ class PersonDialog(QDialog):
         if person is not None:
             self.display_name_edit.setText(person.display_name)
             self.full_name_edit.setText(person.full_name or "")
-            self._set_combo_by_data(self.gender_combo, person.gender or "")
+            _set_combo_by_data(self.gender_combo, person.gender or "")
             self.birth_date_edit.setText(self._normalized_date_text(person.birth_date or ""))
             self.death_date_edit.setText(self._normalized_date_text(person.death_date or ""))
             self.note_edit.setPlainText(person.note or "")
@@ -127,13 +220,6 @@ class PersonDialog(QDialog):
         if self.auto_short_name_check.isChecked():
             self._apply_auto_short_name()
 
-    @staticmethod
-    def _set_combo_by_data(combo: QComboBox, value: str) -> None:
-        for index in range(combo.count()):
-            if combo.itemData(index) == value:
-                combo.setCurrentIndex(index)
-                return
-
     def _build_date_field(self, title: str) -> tuple[QLineEdit, QWidget]:
         edit = QLineEdit()
         edit.setPlaceholderText("дд.мм.гггг, yyyy-mm-dd или yyyy")
@@ -160,11 +246,7 @@ class PersonDialog(QDialog):
         calendar.setGridVisible(True)
         calendar.setSelectedDate(selected)
 
-        button_box = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
-        )
-        button_box.accepted.connect(dialog.accept)
-        button_box.rejected.connect(dialog.reject)
+        button_box = _ok_cancel_box(dialog, dialog.accept, dialog.reject)
 
         layout = QVBoxLayout(dialog)
         layout.addWidget(calendar)
@@ -175,47 +257,38 @@ class PersonDialog(QDialog):
 
     @staticmethod
     def _parse_date_text(value: str) -> QDate | None:
-        text = PersonDialog._normalized_raw_date(value)
+        text = _normalized_raw_date(value)
         if not text:
             return None
-        for fmt in (DATE_FORMAT, "yyyy-MM-dd", "yyyy"):
-            parsed = QDate.fromString(text, fmt)
-            if parsed.isValid():
-                return parsed
-        return None
-
-    @staticmethod
-    def _normalized_raw_date(value: str) -> str:
-        text = value.strip().replace("_", "")
-        if not any(ch.isdigit() for ch in text):
-            return ""
-        return text
+        return _parse_normalized_date(text)
 
     @staticmethod
     def _is_year_text(value: str) -> bool:
-        return bool(YEAR_PATTERN.fullmatch(value))
+        return len(value) == 4 and value.isdecimal()
 
     def _normalized_date_text(self, value: str) -> str:
-        text = self._normalized_raw_date(value)
+        text = _normalized_raw_date(value)
         if not text:
             return ""
         if self._is_year_text(text):
             return text
 
-        parsed = self._parse_date_text(text)
+        parsed = _parse_normalized_date(text)
         if not parsed:
             return text
         return parsed.toString(DATE_FORMAT)
 
     def _pick_photo(self) -> None:
-        path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Выберите фото",
-            "",
-            "Images (*.png *.jpg *.jpeg *.bmp *.webp)",
-        )
-        if not path:
+        if self._photo_dialog is None:
+            self._photo_dialog = QFileDialog(self, "Выберите фото")
+            self._photo_dialog.setNameFilter("Images (*.png *.jpg *.jpeg *.bmp *.webp)")
+            self._photo_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        if not self._photo_dialog.exec():
+            return
+        selected = self._photo_dialog.selectedFiles()
+        if not selected or not selected[0]:
             return
+        path = selected[0]
         self.photo_path_edit.setText(path)
         self._load_preview(path)
 
@@ -225,11 +298,22 @@ class PersonDialog(QDialog):
         self.photo_preview.setText("")
 
     def _on_auto_short_name_toggled(self, checked: bool) -> None:
+        self._set_full_name_tracking(checked)
         if checked:
             self._apply_auto_short_name()
 
+    def _set_full_name_tracking(self, enabled: bool) -> None:
+        if enabled == self._tracking_full_name:
+            return
+        if enabled:
+            self.full_name_edit.textChanged.connect(self._on_full_name_changed)
+        else:
+            self.full_name_edit.textChanged.disconnect(self._on_full_name_changed)
+            self._short_name_timer.stop()
+        self._tracking_full_name = enabled
+
     def _on_full_name_changed(self, _text: str) -> None:
-        self._apply_auto_short_name()
+        self._short_name_timer.start()
 
     def _apply_auto_short_name(self) -> None:
         if not self.auto_short_name_check.isChecked():
@@ -239,11 +323,17 @@ class PersonDialog(QDialog):
         if not generated:
             return
 
-        current = self.display_name_edit.text().strip()
+        text = self.display_name_edit.text()
+        if text == generated:
+            self._last_auto_display_name = generated
+            return
+
+        current = text.strip()
         if current and current != self._last_auto_display_name:
             return
 
-        self.display_name_edit.setText(generated)
+        with QSignalBlocker(self.display_name_edit):
+            self.display_name_edit.setText(generated)
         self._last_auto_display_name = generated
 
     def _load_preview(self, path: str | None) -> None:
@@ -252,21 +342,20 @@ class PersonDialog(QDialog):
             self.photo_preview.setText("")
             self.photo_preview.clear()
             return
-        pixmap = QPixmap(path)
-        if pixmap.isNull():
+        scaled = _preview_pixmap(path, self.photo_preview.width(), self.photo_preview.height())
+        if scaled.isNull():
             self.photo_preview.setPixmap(QPixmap())
             self.photo_preview.setText("Нет превью")
             return
-        scaled = pixmap.scaled(
-            self.photo_preview.width(),
-            self.photo_preview.height(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
         self.photo_preview.setText("")
         self.photo_preview.setPixmap(scaled)
 
     def _accept(self) -> None:
+        self._validated = None
+        if self._short_name_timer.isActive():
+            self._short_name_timer.stop()
+            self._apply_auto_short_name()
+
         display_name = self.display_name_edit.text().strip()
         full_name = self.full_name_edit.text().strip()
 
@@ -284,16 +373,18 @@ class PersonDialog(QDialog):
             )
             return
 
+        dates: list[str | None] = []
         for field_name, edit in (
             ("Дата рождения", self.birth_date_edit),
             ("Дата смерти", self.death_date_edit),
         ):
-            raw = self._normalized_raw_date(edit.text())
+            raw = _normalized_raw_date(edit.text())
             if not raw:
                 edit.clear()
+                dates.append(None)
                 continue
 
-            parsed = self._parse_date_text(raw)
+            parsed = _parse_normalized_date(raw)
             if parsed is None:
                 QMessageBox.warning(
                     self,
@@ -305,20 +396,27 @@ class PersonDialog(QDialog):
                 )
                 return
 
-            if self._is_year_text(raw):
-                edit.setText(raw)
-            else:
-                edit.setText(parsed.toString(DATE_FORMAT))
+            value = raw if self._is_year_text(raw) else parsed.toString(DATE_FORMAT)
+            edit.setText(value)
+            dates.append(value)
 
+        self._validated = (display_name, full_name or None, dates[0], dates[1])
         self.accept()
 
     def build_person(self) -> Person:
         person = self._source_person or Person(id=new_id())
-        person.display_name = self.display_name_edit.text().strip()
-        person.full_name = self.full_name_edit.text().strip() or None
+        if self._validated is not None:
+            display_name, full_name, birth_date, death_date = self._validated
+        else:
+            display_name = self.display_name_edit.text().strip()
+            full_name = self.full_name_edit.text().strip() or None
+            birth_date = self.birth_date_edit.text().strip() or None
+            death_date = self.death_date_edit.text().strip() or None
+        person.display_name = display_name
+        person.full_name = full_name
         person.gender = str(self.gender_combo.currentData() or "") or None
-        person.birth_date = self.birth_date_edit.text().strip() or None
-        person.death_date = self.death_date_edit.text().strip() or None
+        person.birth_date = birth_date
+        person.death_date = death_date
         person.note = self.note_edit.toPlainText().strip() or None
         raw_photo = self.photo_path_edit.text().strip()
         person.photo_path = raw_photo or None
@@ -334,16 +432,18 @@ class RelationshipDialog(QDialog):
         fixed_from_id: str | None = None,
         fixed_to_id: str | None = None,
         parent=None,  # noqa: ANN001
+        excluded_keys: Collection[Hashable] = (),
     ) -> None:
         super().__init__(parent)
         self.setWindowTitle("Связь")
         self._source_relationship = relationship
+        self._excluded_keys = excluded_keys
+        self._own_key = relationship.key() if relationship else None
 
         self.rel_type_combo = QComboBox()
-        self.rel_type_combo.addItem("Родитель -> ребенок", "parent")
-        self.rel_type_combo.addItem("Супруги", "spouse")
+        self.rel_type_combo.setModel(_choice_model(_RELATIONSHIP_TYPE_CHOICES))
         if forced_type:
-            self._set_combo_by_data(self.rel_type_combo, forced_type)
+            _set_combo_by_data(self.rel_type_combo, forced_type)
             self.rel_type_combo.setEnabled(False)
 
         self.from_combo = QComboBox()
@@ -358,22 +458,32 @@ class RelationshipDialog(QDialog):
                 completer.setFilterMode(Qt.MatchFlag.MatchContains)
                 completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
 
-        sorted_people = sorted(
-            people,
-            key=lambda person: (
-                (person.display_name or person.full_name or "").lower(),
-                person.id,
-            ),
-        )
-        for person in sorted_people:
+        keyed = [
+            ((person.display_name or person.full_name or "").casefold(), person.id, position)
+            for position, person in enumerate(people)
+        ]
+        keyed.sort()
+        sorted_people = [people[position] for _, _, position in keyed]
+        people_model = QStandardItemModel(len(sorted_people), 1, self)
+        self._person_ids = [person.id for person in sorted_people]
+        self._person_index: dict[str, int] = {}
+        for row, person in enumerate(sorted_people):
             label = person.display_name or person.full_name or person.id
             if person.full_name and person.full_name != label:
                 label = f"{label} ({person.full_name})"
-            self.from_combo.addItem(label, person.id)
-            self.to_combo.addItem(label, person.id)
+            item = QStandardItem(label)
+            item.setData(person.id, Qt.ItemDataRole.UserRole)
+            people_model.setItem(row, 0, item)
+            self._person_index[person.id] = row
+        self.from_combo.setModel(people_model)
+        self.to_combo.setModel(people_model)
+        self._from_id = self._person_id_at(self.from_combo.currentIndex())
+        self._to_id = self._person_id_at(self.to_combo.currentIndex())
+        self.from_combo.currentIndexChanged.connect(self._on_from_index_changed)
+        self.to_combo.currentIndexChanged.connect(self._on_to_index_changed)
 
         if relationship:
-            self._set_combo_by_data(self.rel_type_combo, relationship.type)
+            _set_combo_by_data(self.rel_type_combo, relationship.type)
             self._set_combo_by_person_id(self.from_combo, relationship.from_id)
             self._set_combo_by_person_id(self.to_combo, relationship.to_id)
 
@@ -387,8 +497,8 @@ class RelationshipDialog(QDialog):
             self.to_combo.setEnabled(False)
             self._select_first_different(self.from_combo, fixed_to_id)
 
-        if self.from_combo.currentData() == self.to_combo.currentData():
-            self._select_first_different(self.to_combo, str(self.from_combo.currentData() or ""))
+        if self._from_id == self._to_id:
+            self._select_first_different(self.to_combo, self._from_id or "")
 
         self.from_label = QLabel()
         self.to_label = QLabel()
@@ -402,43 +512,80 @@ class RelationshipDialog(QDialog):
         helper.setWordWrap(True)
         helper.setStyleSheet("color: #475569;")
 
-        button_box = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
-        )
-        button_box.accepted.connect(self._accept)
-        button_box.rejected.connect(self.reject)
+        self.status_label = QLabel()
+        self.status_label.setWordWrap(True)
+        self.status_label.setStyleSheet("color: #b91c1c;")
+
+        button_box = _ok_cancel_box(self, self._accept, self.reject)
+        self._ok_button = button_box.button(QDialogButtonBox.StandardButton.Ok)
 
         layout = QVBoxLayout(self)
         layout.addLayout(form)
         layout.addWidget(helper)
+        layout.addWidget(self.status_label)
         layout.addWidget(button_box)
 
         self.rel_type_combo.currentIndexChanged.connect(self._update_role_labels)
+        self.rel_type_combo.currentIndexChanged.connect(self._update_status)
+        self.from_combo.currentIndexChanged.connect(self._update_status)
+        self.to_combo.currentIndexChanged.connect(self._update_status)
         self._update_role_labels()
+        self._update_status()
 
-    @staticmethod
-    def _set_combo_by_person_id(combo: QComboBox, person_id: str) -> None:
-        for index in range(combo.count()):
-            if combo.itemData(index) == person_id:
-                combo.setCurrentIndex(index)
-                return
+    def _person_id_at(self, index: int) -> str | None:
+        if 0 <= index < len(self._person_ids):
+            return self._person_ids[index]
+        return None
 
-    @staticmethod
-    def _set_combo_by_data(combo: QComboBox, value: str) -> None:
-        for index in range(combo.count()):
-            if combo.itemData(index) == value:
-                combo.setCurrentIndex(index)
-                return
+    def _on_from_index_changed(self, index: int) -> None:
+        self._from_id = self._person_id_at(index)
 
-    @staticmethod
-    def _select_first_different(combo: QComboBox, forbidden_person_id: str) -> None:
-        for index in range(combo.count()):
-            if combo.itemData(index) != forbidden_person_id:
+    def _on_to_index_changed(self, index: int) -> None:
+        self._to_id = self._person_id_at(index)
+
+    def _set_combo_by_person_id(self, combo: QComboBox, person_id: str) -> None:
+        index = self._person_index.get(person_id)
+        if index is not None:
+            combo.setCurrentIndex(index)
+
+    def _select_first_different(self, combo: QComboBox, forbidden_person_id: str) -> None:
+        fallback = None
+        for person_id, index in self._person_index.items():
+            if person_id == forbidden_person_id:
+                continue
+            if combo is self.to_combo:
+                problem = self._selection_problem(self._from_id, person_id)
+            else:
+                problem = self._selection_problem(person_id, self._to_id)
+            if not problem:
                 combo.setCurrentIndex(index)
                 return
+            if fallback is None:
+                fallback = index
+        if fallback is not None:
+            combo.setCurrentIndex(fallback)
+
+    def _current_type(self) -> str:
+        return str(self.rel_type_combo.currentData() or "parent")
+
+    def _selection_problem(self, from_id: str | None, to_id: str | None) -> str:
+        if from_id == to_id:
+            return "Нельзя связать человека с самим собой."
+        if from_id is None or to_id is None:
+            return ""
+        key = relationship_key(self._current_type(), from_id, to_id)
+        if key != self._own_key and key in self._excluded_keys:
+            return "Такая связь уже существует."
+        return ""
+
+    def _update_status(self) -> None:
+        problem = self._selection_problem(self._from_id, self._to_id)
+        self.status_label.setText(problem)
+        self.status_label.setVisible(bool(problem))
+        self._ok_button.setEnabled(not problem)
 
     def _update_role_labels(self) -> None:
-        relationship_type = str(self.rel_type_combo.currentData() or "parent")
+        relationship_type = self._current_type()
         if relationship_type == "spouse":
             self.from_label.setText("Супруг 1")
             self.to_label.setText("Супруг 2")
@@ -448,20 +595,17 @@ class RelationshipDialog(QDialog):
         self.to_label.setText("Ребенок")
 
     def _accept(self) -> None:
-        if self.from_combo.currentData() == self.to_combo.currentData():
-            QMessageBox.warning(
-                self,
-                "Проверка данных",
-                "Нельзя связать человека с самим собой.",
-            )
+        problem = self._selection_problem(self._from_id, self._to_id)
+        if problem:
+            QMessageBox.warning(self, "Проверка данных", problem)
             return
         self.accept()
 
     def build_relationship(self) -> Relationship:
         relationship = self._source_relationship or Relationship(id=new_id())
-        relationship.type = str(self.rel_type_combo.currentData() or "parent")  # type: ignore[assignment]
-        relationship.from_id = str(self.from_combo.currentData())
-        relationship.to_id = str(self.to_combo.currentData())
+        relationship.type = self._current_type()  # type: ignore[assignment]
+        relationship.from_id = str(self._from_id)
+        relationship.to_id = str(self._to_id)
         return relationship
 
 
@@ -473,15 +617,12 @@ class PdfExportDialog(QDialog):
         opts = options or PdfExportOptions()
 
         self.page_size_combo = QComboBox()
-        self.page_size_combo.addItem("A4", "A4")
-        self.page_size_combo.addItem("A3", "A3")
-        self.page_size_combo.addItem("Letter (US)", "Letter")
-        self._set_combo_by_data(self.page_size_combo, opts.page_size)
+        self.page_size_combo.setModel(_choice_model(_PAGE_SIZE_CHOICES))
+        _set_combo_by_data(self.page_size_combo, opts.page_size)
 
         self.orientation_combo = QComboBox()
-        self.orientation_combo.addItem("Книжная", "portrait")
-        self.orientation_combo.addItem("Альбомная", "landscape")
-        self._set_combo_by_data(self.orientation_combo, opts.orientation)
+        self.orientation_combo.setModel(_choice_model(_ORIENTATION_CHOICES))
+        _set_combo_by_data(self.orientation_combo, opts.orientation)
 
         self.margin_spin = QSpinBox()
         self.margin_spin.setRange(0, 50)
@@ -495,30 +636,24 @@ class PdfExportDialog(QDialog):
         self.fit_check = QCheckBox("Уместить схему на страницу")
         self.fit_check.setChecked(opts.fit_to_page)
 
+        self.rasterize_check = QCheckBox("Растровый PDF (быстрее для больших схем)")
+        self.rasterize_check.setToolTip("Схема сохраняется одной картинкой, текст не выделяется")
+        self.rasterize_check.setChecked(opts.rasterize)
+
         form = QFormLayout()
         form.addRow("Формат бумаги", self.page_size_combo)
         form.addRow("Ориентация", self.orientation_combo)
         form.addRow("Поля", self.margin_spin)
         form.addRow("Качество (DPI)", self.dpi_combo)
         form.addRow("", self.fit_check)
+        form.addRow("", self.rasterize_check)
 
-        button_box = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
-        )
-        button_box.accepted.connect(self.accept)
-        button_box.rejected.connect(self.reject)
+        button_box = _ok_cancel_box(self, self.accept, self.reject)
 
         layout = QVBoxLayout(self)
         layout.addLayout(form)
         layout.addWidget(button_box)
 
-    @staticmethod
-    def _set_combo_by_data(combo: QComboBox, value: str) -> None:
-        for index in range(combo.count()):
-            if combo.itemData(index) == value:
-                combo.setCurrentIndex(index)
-                return
-
     def build_options(self) -> PdfExportOptions:
         return PdfExportOptions(
             page_size=str(self.page_size_combo.currentData() or "A4"),
@@ -526,4 +661,5 @@ class PdfExportDialog(QDialog):
             margin_mm=float(self.margin_spin.value()),
             fit_to_page=self.fit_check.isChecked(),
             dpi=int(self.dpi_combo.currentText()),
+            rasterize=self.rasterize_check.isChecked(),
         )
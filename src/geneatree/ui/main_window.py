@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import os
+from collections.abc import Hashable
 from pathlib import Path
+from typing import ClassVar
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QAction, QPainter
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QAction, QGuiApplication, QPainter, QSurfaceFormat
 from PySide6.QtWidgets import (
+    QApplication,
     QFileDialog,
     QGraphicsScene,
     QGraphicsView,
@@ -30,13 +34,61 @@ class TreeGraphicsView(QGraphicsView):
         )
         self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
         self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.BoundingRectViewportUpdate)
+        self._wheel_delta = 0
+        self._wheel_timer = QTimer(self)
+        self._wheel_timer.setSingleShot(True)
+        self._wheel_timer.setInterval(16)
+        self._wheel_timer.timeout.connect(self._apply_wheel_zoom)
+        self._use_opengl_viewport()
+
+    def _use_opengl_viewport(self) -> None:
+        if QGuiApplication.platformName() in {"offscreen", "minimal"}:
+            return
+        try:
+            from PySide6.QtOpenGLWidgets import QOpenGLWidget
+        except ImportError:
+            return
+        surface_format = QSurfaceFormat()
+        surface_format.setSamples(4)
+        viewport = QOpenGLWidget()
+        viewport.setFormat(surface_format)
+        self.setViewport(viewport)
+        # Every paint clears the whole framebuffer, so partial updates would blank the rest.
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
 
     def wheelEvent(self, event) -> None:  # noqa: ANN001
-        factor = 1.15 if event.angleDelta().y() > 0 else 1 / 1.15
-        self.scale(factor, factor)
+        self._wheel_delta += event.angleDelta().y()
+        if not self._wheel_timer.isActive():
+            self._wheel_timer.start()
+        event.accept()
+
+    def _apply_wheel_zoom(self) -> None:
+        delta, self._wheel_delta = self._wheel_delta, 0
+        if delta:
+            factor = 1.15 ** (delta / 120)
+            self.scale(factor, factor)
 
 
 class MainWindow(QMainWindow):
+    # (attribute, text, shortcut, slot) for every menu/toolbar action.
+    _ACTIONS: ClassVar[tuple[tuple[str, str, str, str], ...]] = (
+        ("new_action", "Новый", "Ctrl+N", "new_project"),
+        ("open_action", "Открыть...", "Ctrl+O", "open_project"),
+        ("save_action", "Сохранить", "Ctrl+S", "save_project"),
+        ("save_as_action", "Сохранить как...", "Ctrl+Shift+S", "save_project_as"),
+        ("export_pdf_action", "Экспорт PDF...", "Ctrl+E", "export_pdf"),
+        ("add_person_action", "Добавить человека", "Ctrl+P", "add_person"),
+        ("add_relationship_action", "Добавить связь", "Ctrl+R", "add_relationship"),
+        ("layout_action", "Автораскладка", "Ctrl+L", "apply_auto_layout"),
+    )
+    # role -> (title, name filter, default file name; None for open dialogs).
+    _FILE_DIALOGS: ClassVar[dict[str, tuple[str, str, str | None]]] = {
+        "open_project": ("Открыть проект", "JSON (*.json)", None),
+        "save_project": ("Сохранить проект", "JSON (*.json)", "drevo.json"),
+        "export_pdf": ("Экспорт PDF", "PDF (*.pdf)", "drevo.pdf"),
+    }
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("Генеалогическое древо")
@@ -46,53 +98,31 @@ class MainWindow(QMainWindow):
         self.project_path: Path | None = None
 
         self.scene = QGraphicsScene(self)
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         self.view = TreeGraphicsView(self.scene, self)
         self.setCentralWidget(self.view)
 
         self.person_items: dict[str, PersonItem] = {}
         self.edge_items: dict[str, EdgeItem] = {}
+        self._layout_signature: tuple[tuple[str, float, float], ...] | None = None
+        self._relationship_keys: set[Hashable] = set()
+        self._file_dialogs: dict[str, QFileDialog] = {}
 
         self._build_actions()
         self._build_menu()
         self._build_toolbar()
-        self.refresh_scene()
+        QTimer.singleShot(0, self, self.refresh_scene)
         self.statusBar().showMessage(
             "Подсказка: двойной клик по карточке открывает редактирование.",
             7000,
         )
 
     def _build_actions(self) -> None:
-        self.new_action = QAction("Новый", self)
-        self.new_action.setShortcut("Ctrl+N")
-        self.new_action.triggered.connect(self.new_project)
-
-        self.open_action = QAction("Открыть...", self)
-        self.open_action.setShortcut("Ctrl+O")
-        self.open_action.triggered.connect(self.open_project)
-
-        self.save_action = QAction("Сохранить", self)
-        self.save_action.setShortcut("Ctrl+S")
-        self.save_action.triggered.connect(self.save_project)
-
-        self.save_as_action = QAction("Сохранить как...", self)
-        self.save_as_action.setShortcut("Ctrl+Shift+S")
-        self.save_as_action.triggered.connect(self.save_project_as)
-
-        self.export_pdf_action = QAction("Экспорт PDF...", self)
-        self.export_pdf_action.setShortcut("Ctrl+E")
-        self.export_pdf_action.triggered.connect(self.export_pdf)
-
-        self.add_person_action = QAction("Добавить человека", self)
-        self.add_person_action.setShortcut("Ctrl+P")
-        self.add_person_action.triggered.connect(self.add_person)
-
-        self.add_relationship_action = QAction("Добавить связь", self)
-        self.add_relationship_action.setShortcut("Ctrl+R")
-        self.add_relationship_action.triggered.connect(self.add_relationship)
-
-        self.layout_action = QAction("Автораскладка", self)
-        self.layout_action.setShortcut("Ctrl+L")
-        self.layout_action.triggered.connect(self.apply_auto_layout)
+        for attr, text, shortcut, slot in self._ACTIONS:
+            action = QAction(text, self)
+            action.setShortcut(shortcut)
+            action.triggered.connect(getattr(self, slot))
+            setattr(self, attr, action)
 
     def _build_menu(self) -> None:
         file_menu = self.menuBar().addMenu("Файл")
@@ -122,6 +152,24 @@ class MainWindow(QMainWindow):
         toolbar.addSeparator()
         toolbar.addAction(self.export_pdf_action)
 
+    def _ask_path(self, role: str) -> str | None:
+        dialog = self._file_dialogs.get(role)
+        if dialog is None:
+            title, name_filter, default_name = self._FILE_DIALOGS[role]
+            dialog = QFileDialog(self, title, "", name_filter)
+            if default_name is None:
+                dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
+                dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+            else:
+                dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+                dialog.setFileMode(QFileDialog.FileMode.AnyFile)
+                dialog.selectFile(default_name)
+            self._file_dialogs[role] = dialog
+        if not dialog.exec():
+            return None
+        selected = dialog.selectedFiles()
+        return selected[0] if selected and selected[0] else None
+
     def _update_window_title(self) -> None:
         filename = self.project_path.name if self.project_path else "Без имени"
         self.setWindowTitle(f"Генеалогическое древо - {filename}")
@@ -130,6 +178,11 @@ class MainWindow(QMainWindow):
         if not self.project_path:
             return
         project_dir = self.project_path.parent
+        try:
+            with os.scandir(project_dir / "assets") as entries:
+                asset_names = {entry.name for entry in entries}
+        except OSError:
+            asset_names = set()
         for person in self.project.people:
             if not person.photo_path:
                 continue
@@ -137,24 +190,25 @@ class MainWindow(QMainWindow):
             if photo.is_absolute():
                 continue
             candidate = project_dir / photo
-            if candidate.exists():
+            in_assets = len(photo.parts) == 2 and photo.parts[0] == "assets"
+            if (in_assets and photo.name in asset_names) or candidate.exists():
                 person.photo_path = str(candidate)
 
     def new_project(self) -> None:
         self.project = TreeProject()
         self.project_path = None
-        self.refresh_scene()
+        self.refresh_scene(reset=True)
         self._update_window_title()
 
     def open_project(self) -> None:
-        path, _ = QFileDialog.getOpenFileName(self, "Открыть проект", "", "JSON (*.json)")
+        path = self._ask_path("open_project")
         if not path:
             return
         try:
             self.project = load_project(path)
             self.project_path = Path(path)
             self._ensure_absolute_photo_paths()
-            self.refresh_scene()
+            self.refresh_scene(reset=True)
             self._update_window_title()
             self.statusBar().showMessage(f"Проект открыт: {self.project_path}", 3000)
         except StorageError as exc:
@@ -173,12 +227,7 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Ошибка сохранения", str(exc))
 
     def save_project_as(self) -> None:
-        path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Сохранить проект",
-            "drevo.json",
-            "JSON (*.json)",
-        )
+        path = self._ask_path("save_project")
         if not path:
             return
 
@@ -199,7 +248,7 @@ class MainWindow(QMainWindow):
         scene_center = self.view.mapToScene(self.view.viewport().rect().center())
         person.pos.x = float(scene_center.x())
         person.pos.y = float(scene_center.y())
-        self.project.people.append(person)
+        self.project.add_person(person)
         self.refresh_scene()
         self.statusBar().showMessage(f"Добавлен: {person.display_name}", 2500)
 
@@ -212,7 +261,11 @@ class MainWindow(QMainWindow):
             return
 
         dialog.build_person()
-        self.refresh_scene()
+        item = self.person_items.get(person_id)
+        if item is None:
+            self.refresh_scene()
+            return
+        item.refresh_from_model()
 
     def delete_person(self, person_id: str) -> None:
         person = self.project.get_person(person_id)
@@ -251,6 +304,7 @@ class MainWindow(QMainWindow):
             fixed_from_id=fixed_from_id,
             fixed_to_id=fixed_to_id,
             parent=self,
+            excluded_keys=self._relationship_keys,
         )
         if dialog.exec() != RelationshipDialog.DialogCode.Accepted:
             return
@@ -266,19 +320,7 @@ class MainWindow(QMainWindow):
         self.statusBar().showMessage("Связь добавлена", 2500)
 
     def _is_duplicate_relationship(self, relationship: Relationship) -> bool:
-        if relationship.type == "spouse":
-            pair = {relationship.from_id, relationship.to_id}
-            return any(
-                rel.type == "spouse" and {rel.from_id, rel.to_id} == pair
-                for rel in self.project.relationships
-            )
-
-        return any(
-            rel.type == relationship.type
-            and rel.from_id == relationship.from_id
-            and rel.to_id == relationship.to_id
-            for rel in self.project.relationships
-        )
+        return relationship.key() in self._relationship_keys
 
     def on_link_requested(self, person_id: str, mode: str) -> None:
         if mode == "add_child":
@@ -290,7 +332,7 @@ class MainWindow(QMainWindow):
 
     def apply_auto_layout(self) -> None:
         auto_layout(self.project)
-        self.refresh_scene()
+        self.refresh_scene(fit=True)
 
     def export_pdf(self) -> None:
         if not self.project.people:
@@ -308,7 +350,7 @@ class MainWindow(QMainWindow):
 
         options = dialog.build_options()
 
-        path, _ = QFileDialog.getSaveFileName(self, "Экспорт PDF", "drevo.pdf", "PDF (*.pdf)")
+        path = self._ask_path("export_pdf")
         if not path:
             return
 
@@ -316,48 +358,112 @@ class MainWindow(QMainWindow):
         if target.suffix.lower() != ".pdf":
             target = target.with_suffix(".pdf")
 
+        self.statusBar().showMessage(f"Экспорт PDF: {target}...")
+        # Rendering blocks the event loop, so paint the message before it starts.
+        self.statusBar().repaint()
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
         try:
             export_scene_to_pdf(self.scene, target, options)
-            self.project.settings.page_size = options.page_size
-            self.project.settings.orientation = options.orientation
-            self.project.settings.margin_mm = options.margin_mm
-            self.statusBar().showMessage(f"PDF экспортирован: {target}", 3000)
         except Exception as exc:  # noqa: BLE001
-            QMessageBox.critical(self, "Ошибка экспорта", str(exc))
+            error: Exception | None = exc
+        else:
+            error = None
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        if error is not None:
+            self.statusBar().clearMessage()
+            QMessageBox.critical(self, "Ошибка экспорта", str(error))
+            return
 
-    def refresh_scene(self) -> None:
-        for edge in self.edge_items.values():
-            edge.detach()
-        self.edge_items.clear()
+        self.project.settings.page_size = options.page_size
+        self.project.settings.orientation = options.orientation
+        self.project.settings.margin_mm = options.margin_mm
+        self.statusBar().showMessage(f"PDF экспортирован: {target}", 3000)
 
-        self.scene.clear()
-        self.person_items.clear()
+    def refresh_scene(self, reset: bool = False, fit: bool = False) -> None:
+        self.view.setUpdatesEnabled(False)
+        signals_blocked = self.scene.blockSignals(True)
+        try:
+            if reset:
+                self.edge_items.clear()
+                self.scene.clear()
+                self.person_items.clear()
+                self._layout_signature = None
+
+            people_added = self._sync_people()
+            self._sync_edges()
+        finally:
+            self.scene.blockSignals(signals_blocked)
+            self.view.setUpdatesEnabled(True)
+
+        signature = tuple((person.id, person.pos.x, person.pos.y) for person in self.project.people)
+        if signature != self._layout_signature:
+            self._layout_signature = signature
+            if self.person_items:
+                rect = self.scene.itemsBoundingRect().adjusted(-300, -300, 300, 300)
+                self.scene.setSceneRect(rect)
+                if reset or fit or people_added:
+                    self.view.fitInView(rect, Qt.AspectRatioMode.KeepAspectRatio)
+            else:
+                self.scene.setSceneRect(-500, -300, 1000, 600)
+
+        self.view.viewport().update()
+        self._update_window_title()
 
+    def _sync_people(self) -> bool:
         width = self.project.settings.card_width
         height = self.project.settings.card_height
+        people = self.project.people
+        added = False
 
-        for person in self.project.people:
+        for person_id in self.person_items.keys() - {person.id for person in people}:
+            self.scene.removeItem(self.person_items.pop(person_id))
+
+        for person in people:
+            person_id = person.id
+            item = self.person_items.get(person_id)
+            if item is not None:
+                item.update_from(person, width, height)
+                continue
             item = PersonItem(person, width=width, height=height)
             item.edit_requested.connect(self.edit_person)
             item.delete_requested.connect(self.delete_person)
             item.link_requested.connect(self.on_link_requested)
             self.scene.addItem(item)
-            self.person_items[person.id] = item
-
+            self.person_items[person_id] = item
+            added = True
+        return added
+
+    def _sync_edges(self) -> None:
+        current: set[str] = set()
+        keys = self._relationship_keys
+        keys.clear()
         for relationship in self.project.relationships:
+            keys.add(relationship.key())
             source = self.person_items.get(relationship.from_id)
             target = self.person_items.get(relationship.to_id)
             if source is None or target is None:
                 continue
+            current.add(relationship.id)
+            edge = self.edge_items.get(relationship.id)
+            if edge is not None:
+                if (
+                    edge.source is source
+                    and edge.target is target
+                    and edge.relationship_type == relationship.type
+                ):
+                    edge.flush()
+                    continue
+                self._remove_edge_item(relationship.id)
             edge = EdgeItem(source, target, relationship.type)
             self.scene.addItem(edge)
             self.edge_items[relationship.id] = edge
 
-        if self.person_items:
-            rect = self.scene.itemsBoundingRect().adjusted(-300, -300, 300, 300)
-            self.scene.setSceneRect(rect)
-            self.view.fitInView(rect, Qt.AspectRatioMode.KeepAspectRatio)
-        else:
-            self.scene.setSceneRect(-500, -300, 1000, 600)
+        for relationship_id in self.edge_items.keys() - current:
+            self._remove_edge_item(relationship_id)
 
-        self._update_window_title()
+    def _remove_edge_item(self, relationship_id: str) -> None:
+        edge = self.edge_items.pop(relationship_id)
+        edge.detach()
+        self.scene.removeItem(edge)
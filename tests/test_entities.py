@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import sys
+
+from geneatree.model.entities import Person, Relationship, TreeProject
+
+
+def test_people_index_follows_mutations() -> None:
+    first = Person(display_name="First")
+    second = Person(display_name="Second")
+    project = TreeProject(people=[first])
+
+    assert project.get_person(first.id) is first
+    assert project.get_person(second.id) is None
+
+    project.add_person(second)
+    assert project.get_person(second.id) is second
+
+    project.remove_person(first.id)
+    assert project.get_person(first.id) is None
+    assert project.people_by_id() == {second.id: second}
+
+
+def test_people_index_is_updated_in_place() -> None:
+    first = Person(display_name="First")
+    project = TreeProject(people=[first])
+    index = project.people_by_id()
+
+    second = Person(display_name="Second")
+    project.add_person(second)
+    project.remove_person(first.id)
+
+    assert project.people_by_id() is index
+    assert index == {second.id: second}
+
+
+def test_people_index_notices_direct_list_changes() -> None:
+    first = Person(display_name="First")
+    project = TreeProject(people=[first])
+    assert project.get_person(first.id) is first
+
+    late = Person(display_name="Late")
+    project.people.append(late)
+    assert project.get_person(late.id) is late
+
+
+def test_people_index_follows_list_replacement() -> None:
+    first = Person(display_name="First")
+    project = TreeProject(people=[first])
+    assert project.get_person(first.id) is first
+
+    other = Person(display_name="Other")
+    project.people = [other]
+    assert project.get_person(first.id) is None
+    assert project.get_person(other.id) is other
+
+
+def test_people_index_can_be_invalidated_after_in_place_edits() -> None:
+    first = Person(display_name="First")
+    project = TreeProject(people=[first])
+    assert project.get_person(first.id) is first
+
+    other = Person(display_name="Other")
+    project.people[0] = other
+    project.invalidate_people_index()
+    assert project.people_by_id() == {other.id: other}
+
+
+def test_remove_person_drops_relationships() -> None:
+    parent = Person(display_name="Parent")
+    child = Person(display_name="Child")
+    project = TreeProject(
+        people=[parent, child],
+        relationships=[Relationship(type="parent", from_id=parent.id, to_id=child.id)],
+    )
+
+    project.remove_person(child.id)
+
+    assert project.relationships == []
+
+
+def test_to_dict_copies_nested_dicts_by_default() -> None:
+    person = Person(display_name="Styled", style={"border": "#000"})
+    project = TreeProject(people=[person], assets_manifest={person.id: "assets/x.jpg"})
+
+    copied = project.to_dict()
+    assert copied["people"][0]["style"] == person.style
+    assert copied["people"][0]["style"] is not person.style
+    assert copied["assets_manifest"] is not project.assets_manifest
+
+    shared = project.to_dict(copy=False)
+    assert shared["people"][0]["style"] is person.style
+    assert shared["assets_manifest"] is project.assets_manifest
+
+
+def test_relationship_key_ignores_spouse_direction() -> None:
+    spouse = Relationship(type="spouse", from_id="a", to_id="b")
+    reversed_spouse = Relationship(type="spouse", from_id="b", to_id="a")
+    parent = Relationship(type="parent", from_id="a", to_id="b")
+    reversed_parent = Relationship(type="parent", from_id="b", to_id="a")
+
+    assert spouse.key() == reversed_spouse.key()
+    assert parent.key() != reversed_parent.key()
+    assert spouse.key() != parent.key()
+
+
+def test_relationship_type_is_interned_on_load() -> None:
+    loaded = Relationship.from_dict({"type": "".join(["spo", "use"])})
+
+    assert loaded.type is sys.intern("spouse")
@@ -31,3 +31,53 @@ def test_generation_layout_order() -> None:
     assert gp.pos.y < p1.pos.y
     assert p1.pos.y == p2.pos.y
     assert child.pos.y > p1.pos.y
+
+
+def test_generations_use_longest_parent_path() -> None:
+    root = Person(display_name="Root")
+    middle = Person(display_name="Middle")
+    leaf = Person(display_name="Leaf")
+
+    project = TreeProject(
+        people=[leaf, middle, root],
+        relationships=[
+            Relationship(type="parent", from_id=root.id, to_id=leaf.id),
+            Relationship(type="parent", from_id=middle.id, to_id=leaf.id),
+            Relationship(type="parent", from_id=root.id, to_id=middle.id),
+        ],
+    )
+
+    levels = compute_generations(project)
+    assert levels == {root.id: 0, middle.id: 1, leaf.id: 2}
+
+
+def test_generations_terminate_on_parent_cycle() -> None:
+    first = Person(display_name="First")
+    second = Person(display_name="Second")
+
+    project = TreeProject(
+        people=[first, second],
+        relationships=[
+            Relationship(type="parent", from_id=first.id, to_id=second.id),
+            Relationship(type="parent", from_id=second.id, to_id=first.id),
+        ],
+    )
+
+    levels = compute_generations(project)
+    assert set(levels) == {first.id, second.id}
+
+
+def test_layout_spaces_rows_evenly_around_start() -> None:
+    people = [Person(display_name=name) for name in ("C", "A", "B")]
+    project = TreeProject(people=people)
+    spacing = project.settings.sibling_spacing
+
+    auto_layout(project, start_x=100.0, start_y=50.0)
+
+    by_name = {person.display_name: person for person in people}
+    assert [by_name[name].pos.x for name in ("A", "B", "C")] == [
+        100.0 - spacing,
+        100.0,
+        100.0 + spacing,
+    ]
+    assert {person.pos.y for person in people} == {50.0}
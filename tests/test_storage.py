@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import os
+import stat
+import sys
 from pathlib import Path
 
+import pytest
+
+from geneatree.model import storage
 from geneatree.model.entities import Person, Position, Relationship, TreeProject
-from geneatree.model.storage import load_project, save_project
+from geneatree.model.storage import StorageError, load_project, save_project
 
 
 def test_save_and_load_roundtrip(tmp_path: Path) -> None:
@@ -46,3 +52,109 @@ def test_save_ignores_missing_photo_file(tmp_path: Path) -> None:
 
     loaded = load_project(project_path)
     assert loaded.people[0].photo_path == "missing.jpg"
+
+
+def test_save_copies_every_photo_into_assets(tmp_path: Path) -> None:
+    people = []
+    for index in range(5):
+        photo = tmp_path / f"photo{index}.PNG"
+        photo.write_bytes(f"fakepng{index}".encode())
+        people.append(Person(display_name=f"Person {index}", photo_path=str(photo)))
+    people.append(Person(display_name="No Photo"))
+
+    project = TreeProject(people=people)
+    project_path = tmp_path / "tree.json"
+    save_project(project, project_path)
+
+    loaded = load_project(project_path)
+    for index, person in enumerate(people[:5]):
+        assert person.photo_path == f"assets/{person.id}.png"
+        assert (tmp_path / person.photo_path).read_bytes() == f"fakepng{index}".encode()
+        assert loaded.assets_manifest[person.id] == person.photo_path
+    assert people[5].id not in loaded.assets_manifest
+
+
+def test_save_replaces_existing_file_without_leftovers(tmp_path: Path) -> None:
+    project_path = tmp_path / "tree.json"
+    project_path.write_text("old contents that are longer than nothing", encoding="utf-8")
+
+    save_project(TreeProject(people=[Person(display_name="Новый")]), project_path)
+
+    loaded = load_project(project_path)
+    assert loaded.people[0].display_name == "Новый"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["assets", "tree.json"]
+
+
+def test_resave_keeps_staged_photo(tmp_path: Path) -> None:
+    source_photo = tmp_path / "source.jpg"
+    source_photo.write_bytes(b"fakejpg")
+    person = Person(display_name="Photo", photo_path=str(source_photo))
+    project = TreeProject(people=[person])
+    project_path = tmp_path / "tree.json"
+
+    save_project(project, project_path)
+    staged = tmp_path / person.photo_path
+    save_project(project, project_path)
+
+    assert person.photo_path == f"assets/{person.id}.jpg"
+    assert staged.read_bytes() == b"fakejpg"
+
+
+def test_stdlib_json_fallback_roundtrip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(storage, "orjson", None)
+    person = Person(display_name="Иван", full_name="Иванов Иван")
+    project_path = tmp_path / "tree.json"
+
+    save_project(TreeProject(people=[person]), project_path)
+
+    assert "Иванов Иван" in project_path.read_text(encoding="utf-8")
+    loaded = load_project(project_path)
+    assert loaded.people[0].full_name == "Иванов Иван"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_load_rejects_invalid_json(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if use_orjson:
+        if storage.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(storage, "orjson", None)
+    project_path = tmp_path / "broken.json"
+    project_path.write_bytes(b'{"people": [')
+
+    with pytest.raises(StorageError):
+        load_project(project_path)
+
+
+def test_failed_encoding_keeps_previous_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(storage, "orjson", None)
+    project_path = tmp_path / "tree.json"
+    person = Person(display_name="Saved")
+    save_project(TreeProject(people=[person]), project_path)
+    before = project_path.read_bytes()
+
+    person.style["broken"] = object()
+    with pytest.raises(TypeError):
+        save_project(TreeProject(people=[person]), project_path)
+
+    assert project_path.read_bytes() == before
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions and symlinks")
+def test_save_keeps_mode_and_symlink_of_existing_file(tmp_path: Path) -> None:
+    real_path = tmp_path / "real.json"
+    link_path = tmp_path / "tree.json"
+    save_project(TreeProject(people=[Person(display_name="First")]), real_path)
+    os.chmod(real_path, 0o600)
+    link_path.symlink_to(real_path)
+
+    save_project(TreeProject(people=[Person(display_name="Second")]), link_path)
+
+    assert link_path.is_symlink()
+    assert stat.S_IMODE(real_path.stat().st_mode) == 0o600
+    assert load_project(real_path).people[0].display_name == "Second"
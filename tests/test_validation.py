@@ -48,3 +48,36 @@ def test_detects_person_without_any_name() -> None:
 
     errors = validate_project(project)
     assert any("has no display_name or full_name" in error.lower() for error in errors)
+
+
+def test_long_lineage_does_not_hit_recursion_limit() -> None:
+    people = [Person(display_name=f"Gen {index}") for index in range(5000)]
+    relationships = [
+        Relationship(type="parent", from_id=parent.id, to_id=child.id)
+        for parent, child in zip(people, people[1:])
+    ]
+    project = TreeProject(people=people, relationships=relationships)
+
+    assert validate_project(project) == []
+
+    relationships.append(Relationship(type="parent", from_id=people[-1].id, to_id=people[0].id))
+    errors = validate_project(project)
+    assert any("cycle" in error.lower() for error in errors)
+
+
+def test_detects_duplicate_person_and_relationship_ids() -> None:
+    first = Person(id="same", display_name="A")
+    second = Person(id="same", display_name="B")
+    third = Person(display_name="C")
+
+    project = TreeProject(
+        people=[first, second, third],
+        relationships=[
+            Relationship(id="rel", type="parent", from_id=first.id, to_id=third.id),
+            Relationship(id="rel", type="spouse", from_id=first.id, to_id=third.id),
+        ],
+    )
+
+    errors = validate_project(project)
+    assert "Duplicate person ids: ['same']" in errors
+    assert "Duplicate relationship ids: ['rel']" in errors